@@ -20,10 +20,55 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
-from typing import Optional, Union
+import numbers
+from typing import Optional
+
+import numpy as np
 
 from ansys.mapdl.core.mapdl_types import MapdlFloat, MapdlInt
 
+# MAPDL only reads the first four characters of these labels.
+_REFINE_POST = ("OFF", "SMOOTH", "CLEAN")
+_REFINE_RETAIN = ("ON", "OFF")
+
+
+def _is_valid_label(label, valid):
+    """Return whether ``label`` is one of ``valid`` or an APDL substitution."""
+    if label == "" or (label.startswith("%") and label.endswith("%")):
+        return True
+    return label.upper()[:4] in [each[:4] for each in valid]
+
+
+def _check_refine_options(level, post, retain):
+    """Check the options shared by the xREFINE commands before sending them.
+
+    Numbers must be integers within the allowed values. Strings in numeric
+    fields are passed through untouched since they may be APDL parameters.
+    Labels are checked, unless they are ``%par%`` substitutions.
+    """
+    if isinstance(level, (bool, np.bool_)) or (
+        isinstance(level, numbers.Real) and level not in range(1, 6)
+    ):
+        raise ValueError(f"'level' must be an integer from 1 to 5, not {level}.")
+
+    if isinstance(post, str) and not _is_valid_label(post, _REFINE_POST):
+        raise ValueError(f"'post' must be 'OFF', 'SMOOTH' or 'CLEAN', not '{post}'.")
+
+    if isinstance(retain, str) and not _is_valid_label(retain, _REFINE_RETAIN):
+        raise ValueError(f"'retain' must be 'ON' or 'OFF', not '{retain}'.")
+
+
+def _check_key(key, valid):
+    """Check an integer key against its allowed values before sending it.
+
+    Numbers must be in ``valid``. Strings are passed through untouched
+    since they may be APDL parameters.
+    """
+    if isinstance(key, (bool, np.bool_)) or (
+        isinstance(key, numbers.Real) and key not in valid
+    ):
+        raise ValueError(f"'key' must be one of {valid}, not {key}.")
+
 
 class Meshing:
     def accat(self, na1="", na2="", **kwargs):
@@ -77,7 +122,7 @@ class Meshing:
         in one step.
         """
         command = f"ACCAT,{na1},{na2}"
-        return self.run(command, **kwargs)
+        return self.run(command.rstrip(","), **kwargs)
 
     def aclear(self, na1="", na2="", ninc="", **kwargs):
         """Deletes nodes and area elements associated with selected areas.
@@ -109,7 +154,7 @@ class Meshing:
         ACLEAR clears only the area generated by the AREMESH command.
         """
         command = f"ACLEAR,{na1},{na2},{ninc}"
-        return self.run(command, **kwargs)
+        return self.run(command.rstrip(","), **kwargs)
 
     def aesize(self, anum="", size="", **kwargs):
         """Specifies the element size to be meshed onto areas.
@@ -142,7 +187,7 @@ class Meshing:
         This command is also valid for rezoning.
         """
         command = f"AESIZE,{anum},{size}"
-        return self.run(command, **kwargs)
+        return self.run(command.rstrip(","), **kwargs)
 
     def amap(self, area="", kp1="", kp2="", kp3="", kp4="", **kwargs):
         """Generates a 2-D mapped mesh based on specified area corners.
@@ -176,7 +221,7 @@ class Meshing:
         poor element shapes, the meshing operation is aborted.
         """
         command = f"AMAP,{area},{kp1},{kp2},{kp3},{kp4}"
-        return self.run(command, **kwargs)
+        return self.run(command.rstrip(","), **kwargs)
 
     def amesh(self, na1="", na2="", ninc="", **kwargs):
         """Generates nodes and area elements within areas.
@@ -201,7 +246,7 @@ class Meshing:
         This command is also valid for rezoning.
         """
         command = f"AMESH,{na1},{na2},{ninc}"
-        return self.run(command, **kwargs)
+        return self.run(command.rstrip(","), **kwargs)
 
     def arefine(
         self,
@@ -284,8 +329,9 @@ class Meshing:
 
         This command is also valid for rezoning.
         """
+        _check_refine_options(level, post, retain)
         command = f"AREFINE,{na1},{na2},{ninc},{level},{depth},{post},{retain}"
-        return self.run(command, **kwargs)
+        return self.run(command.rstrip(","), **kwargs)
 
     def chkmsh(self, comp="", **kwargs):
         """Checks area and volume entities for previous meshes.
@@ -307,7 +353,7 @@ class Meshing:
         in an input file for use with the /INPUT command).
         """
         command = f"CHKMSH,{comp}"
-        return self.run(command, **kwargs)
+        return self.run(command.rstrip(","), **kwargs)
 
     def clrmshln(self, **kwargs):
         """Clears meshed entities.
@@ -330,7 +376,7 @@ class Meshing:
         in directly in an ANSYS session, although it can be included in an
         input file for batch input or for use with the /INPUT command.
         """
-        command = f"CLRMSHLN,"
+        command = "CLRMSHLN"
         return self.run(command, **kwargs)
 
     def cpcyc(
@@ -389,7 +435,7 @@ class Meshing:
         analyses.
         """
         command = f"CPCYC,{lab},{toler},{kcn},{dx},{dy},{dz},{knonrot}"
-        return self.run(command, **kwargs)
+        return self.run(command.rstrip(","), **kwargs)
 
     def czdel(self, grp1="", grp2="", grp3="", **kwargs):
         """Edits or clears cohesive zone sections.
@@ -423,7 +469,7 @@ class Meshing:
         The CZDEL command is valid for structural analyses only.
         """
         command = f"CZDEL,{grp1},{grp2},{grp3}"
-        return self.run(command, **kwargs)
+        return self.run(command.rstrip(","), **kwargs)
 
     def czmesh(
         self,
@@ -496,7 +542,7 @@ class Meshing:
         The CZMESH command is valid for structural analyses only.
         """
         command = f"CZMESH,{ecomps1},{ecomps2},{kcn},{kdir},{value},{cztol}"
-        return self.run(command, **kwargs)
+        return self.run(command.rstrip(","), **kwargs)
 
     def desize(
         self,
@@ -575,12 +621,12 @@ class Meshing:
         command = (
             f"DESIZE,{minl},{minh},{mxel},{angl},{angh},{edgmn},{edgmx},{adjf},{adjm}"
         )
-        return self.run(command, **kwargs)
+        return self.run(command.rstrip(","), **kwargs)
 
     def eorient(
         self,
         etype: str = "",
-        dir_: Union[str, int] = "",
+        dir_: MapdlInt = "",
         toler: MapdlFloat = "",
         **kwargs,
     ) -> Optional[str]:
@@ -671,11 +717,11 @@ class Meshing:
         supported.)
         """
         command = f"EORIENT,{etype},{dir_},{toler}"
-        return self.run(command, **kwargs)
+        return self.run(command.rstrip(","), **kwargs)
 
     def erefine(
         self,
-        ne1: Union[str, int] = "",
+        ne1: MapdlInt = "",
         ne2: MapdlInt = "",
         ninc: MapdlInt = "",
         level: MapdlInt = "",
@@ -764,10 +810,13 @@ class Meshing:
 
         This command is also valid for rezoning.
         """
-        command = f"EREFINE,{ne1},{ne2},{ninc}," f"{level},{depth},{post},{retain}"
-        return self.run(command, **kwargs)
+        _check_refine_options(level, post, retain)
+        command = f"EREFINE,{ne1},{ne2},{ninc},{level},{depth},{post},{retain}"
+        return self.run(command.rstrip(","), **kwargs)
 
-    def esize(self, size="", ndiv="", **kwargs):
+    def esize(
+        self, size: MapdlFloat = "", ndiv: MapdlInt = "", **kwargs
+    ) -> Optional[str]:
         """Specifies the default number of line divisions.
 
         APDL Command: ESIZE
@@ -801,7 +850,7 @@ class Meshing:
         This command is also valid for rezoning.
         """
         command = f"ESIZE,{size},{ndiv}"
-        return self.run(command, **kwargs)
+        return self.run(command.rstrip(","), **kwargs)
 
     def esys(self, kcn: MapdlInt = "", **kwargs) -> Optional[str]:
         """Sets the element coordinate system attribute pointer.
@@ -839,9 +888,9 @@ class Meshing:
         coordinate system numbers may be displayed [/PNUM].
         """
         command = f"ESYS,{kcn}"
-        return self.run(command, **kwargs)
+        return self.run(command.rstrip(","), **kwargs)
 
-    def fvmesh(self, keep="", **kwargs):
+    def fvmesh(self, keep: MapdlInt = "", **kwargs) -> Optional[str]:
         """Generates nodes and tetrahedral volume elements from detached exterior
 
         APDL Command: FVMESH
@@ -894,9 +943,17 @@ class Meshing:
         kept even if KEEP = 0.
         """
         command = f"FVMESH,{keep}"
-        return self.run(command, **kwargs)
+        return self.run(command.rstrip(","), **kwargs)
 
-    def gsgdata(self, lfiber="", xref="", yref="", rotx0="", roty0="", **kwargs):
+    def gsgdata(
+        self,
+        lfiber: MapdlFloat = "",
+        xref: MapdlFloat = "",
+        yref: MapdlFloat = "",
+        rotx0: MapdlFloat = "",
+        roty0: MapdlFloat = "",
+        **kwargs,
+    ) -> Optional[str]:
         """Specifies the reference point and defines the geometry in the fiber
 
         APDL Command: GSGDATA
@@ -928,20 +985,20 @@ class Meshing:
         Technology Solid Elements in the  Element Reference.
         """
         command = f"GSGDATA,{lfiber},{xref},{yref},{rotx0},{roty0}"
-        return self.run(command, **kwargs)
+        return self.run(command.rstrip(","), **kwargs)
 
     def imesh(
         self,
-        laky="",
-        nsla="",
-        ntla="",
-        kcn="",
-        dx="",
-        dy="",
-        dz="",
-        tol="",
+        laky: str = "",
+        nsla: MapdlInt = "",
+        ntla: MapdlInt = "",
+        kcn: MapdlInt = "",
+        dx: MapdlFloat = "",
+        dy: MapdlFloat = "",
+        dz: MapdlFloat = "",
+        tol: MapdlFloat = "",
         **kwargs,
-    ):
+    ) -> Optional[str]:
         """Generates nodes and interface elements along lines or areas.
 
         APDL Command: IMESH
@@ -996,9 +1053,16 @@ class Meshing:
         interface layer according to the following table:
         """
         command = f"IMESH,{laky},{nsla},{ntla},{kcn},{dx},{dy},{dz},{tol}"
-        return self.run(command, **kwargs)
+        return self.run(command.rstrip(","), **kwargs)
 
-    def katt(self, mat="", real="", type_="", esys="", **kwargs):
+    def katt(
+        self,
+        mat: MapdlInt = "",
+        real: MapdlInt = "",
+        type_: MapdlInt = "",
+        esys: MapdlInt = "",
+        **kwargs,
+    ) -> Optional[str]:
         """Associates attributes with the selected, unmeshed keypoints.
 
         APDL Command: KATT
@@ -1030,9 +1094,11 @@ class Meshing:
         in Meshing Your Solid Model in the Modeling and Meshing Guide.
         """
         command = f"KATT,{mat},{real},{type_},{esys}"
-        return self.run(command, **kwargs)
+        return self.run(command.rstrip(","), **kwargs)
 
-    def kclear(self, np1="", np2="", ninc="", **kwargs):
+    def kclear(
+        self, np1: MapdlInt = "", np2: MapdlInt = "", ninc: MapdlInt = "", **kwargs
+    ) -> Optional[str]:
         """Deletes nodes and point elements associated with selected keypoints.
 
         APDL Command: KCLEAR
@@ -1057,9 +1123,16 @@ class Meshing:
         its node or element reference was deleted.
         """
         command = f"KCLEAR,{np1},{np2},{ninc}"
-        return self.run(command, **kwargs)
+        return self.run(command.rstrip(","), **kwargs)
 
-    def kesize(self, npt="", size="", fact1="", fact2="", **kwargs):
+    def kesize(
+        self,
+        npt: MapdlInt = "",
+        size: MapdlFloat = "",
+        fact1: MapdlFloat = "",
+        fact2: MapdlFloat = "",
+        **kwargs,
+    ) -> Optional[str]:
         """Specifies the edge lengths of the elements nearest a keypoint.
 
         APDL Command: KESIZE
@@ -1101,9 +1174,11 @@ class Meshing:
         rezoning.
         """
         command = f"KESIZE,{npt},{size},{fact1},{fact2}"
-        return self.run(command, **kwargs)
+        return self.run(command.rstrip(","), **kwargs)
 
-    def kmesh(self, np1="", np2="", ninc="", **kwargs):
+    def kmesh(
+        self, np1: MapdlInt = "", np2: MapdlInt = "", ninc: MapdlInt = "", **kwargs
+    ) -> Optional[str]:
         """Generates nodes and point elements at keypoints.
 
         APDL Command: KMESH
@@ -1124,19 +1199,19 @@ class Meshing:
         assigned the lowest available numbers.
         """
         command = f"KMESH,{np1},{np2},{ninc}"
-        return self.run(command, **kwargs)
+        return self.run(command.rstrip(","), **kwargs)
 
     def krefine(
         self,
-        np1="",
-        np2="",
-        ninc="",
-        level="",
-        depth="",
-        post="",
-        retain="",
+        np1: MapdlInt = "",
+        np2: MapdlInt = "",
+        ninc: MapdlInt = "",
+        level: MapdlInt = "",
+        depth: MapdlInt = "",
+        post: str = "",
+        retain: str = "",
         **kwargs,
-    ):
+    ) -> Optional[str]:
         """Refines the mesh around specified keypoints.
 
         APDL Command: KREFINE
@@ -1207,10 +1282,19 @@ class Meshing:
 
         This command is also valid for rezoning.
         """
+        _check_refine_options(level, post, retain)
         command = f"KREFINE,{np1},{np2},{ninc},{level},{depth},{post},{retain}"
-        return self.run(command, **kwargs)
+        return self.run(command.rstrip(","), **kwargs)
 
-    def kscon(self, npt="", delr="", kctip="", nthet="", rrat="", **kwargs):
+    def kscon(
+        self,
+        npt: MapdlInt = "",
+        delr: MapdlFloat = "",
+        kctip: MapdlInt = "",
+        nthet: MapdlInt = "",
+        rrat: MapdlFloat = "",
+        **kwargs,
+    ) -> Optional[str]:
         """Specifies a keypoint about which an area mesh will be skewed.
 
         APDL Command: KSCON
@@ -1260,9 +1344,18 @@ class Meshing:
         This command is also valid for rezoning.
         """
         command = f"KSCON,{npt},{delr},{kctip},{nthet},{rrat}"
-        return self.run(command, **kwargs)
+        return self.run(command.rstrip(","), **kwargs)
 
-    def latt(self, mat="", real="", type_="", kb="", ke="", secnum="", **kwargs):
+    def latt(
+        self,
+        mat: MapdlInt = "",
+        real: MapdlInt = "",
+        type_: MapdlInt = "",
+        kb: MapdlInt = "",
+        ke: MapdlInt = "",
+        secnum: MapdlInt = "",
+        **kwargs,
+    ) -> Optional[str]:
         """Associates element attributes with the selected, unmeshed lines.
 
         APDL Command: LATT
@@ -1328,9 +1421,9 @@ class Meshing:
         element attributes.
         """
         command = f"LATT,{mat},{real},{type_},,{kb},{ke},{secnum}"
-        return self.run(command, **kwargs)
+        return self.run(command.rstrip(","), **kwargs)
 
-    def lccat(self, nl1="", nl2="", **kwargs):
+    def lccat(self, nl1: MapdlInt = "", nl2: MapdlInt = "", **kwargs) -> Optional[str]:
         """Concatenates multiple lines into one line for mapped meshing.
 
         APDL Command: LCCAT
@@ -1379,9 +1472,11 @@ class Meshing:
         lines in one step.
         """
         command = f"LCCAT,{nl1},{nl2}"
-        return self.run(command, **kwargs)
+        return self.run(command.rstrip(","), **kwargs)
 
-    def lclear(self, nl1="", nl2="", ninc="", **kwargs):
+    def lclear(
+        self, nl1: MapdlInt = "", nl2: MapdlInt = "", ninc: MapdlInt = "", **kwargs
+    ) -> Optional[str]:
         """Deletes nodes and line elements associated with selected lines.
 
         APDL Command: LCLEAR
@@ -1407,21 +1502,21 @@ class Meshing:
         reference was deleted.
         """
         command = f"LCLEAR,{nl1},{nl2},{ninc}"
-        return self.run(command, **kwargs)
+        return self.run(command.rstrip(","), **kwargs)
 
     def lesize(
         self,
-        nl1="",
-        size="",
-        angsiz="",
-        ndiv="",
-        space="",
-        kforc="",
-        layer1="",
-        layer2="",
-        kyndiv="",
+        nl1: MapdlInt = "",
+        size: MapdlFloat = "",
+        angsiz: MapdlFloat = "",
+        ndiv: MapdlInt = "",
+        space: MapdlFloat = "",
+        kforc: MapdlInt = "",
+        layer1: MapdlFloat = "",
+        layer2: MapdlFloat = "",
+        kyndiv: MapdlInt = "",
         **kwargs,
-    ):
+    ) -> Optional[str]:
         """Specifies the divisions and spacing ratio on unmeshed lines.
 
         APDL Command: LESIZE
@@ -1514,7 +1609,7 @@ class Meshing:
         This command is also valid for rezoning.
         """
         command = f"LESIZE,{nl1},{size},{angsiz},{ndiv},{space},{kforc},{layer1},{layer2},{kyndiv}"
-        return self.run(command, **kwargs)
+        return self.run(command.rstrip(","), **kwargs)
 
     def lmesh(self, nl1="", nl2="", ninc="", **kwargs):
         """Generates nodes and line elements along lines.
@@ -1538,7 +1633,7 @@ class Meshing:
         available numbers.
         """
         command = f"LMESH,{nl1},{nl2},{ninc}"
-        return self.run(command, **kwargs)
+        return self.run(command.rstrip(","), **kwargs)
 
     def lrefine(
         self,
@@ -1621,8 +1716,9 @@ class Meshing:
 
         This command is also valid for rezoning.
         """
+        _check_refine_options(level, post, retain)
         command = f"LREFINE,{nl1},{nl2},{ninc},{level},{depth},{post},{retain}"
-        return self.run(command, **kwargs)
+        return self.run(command.rstrip(","), **kwargs)
 
     def mat(self, mat="", **kwargs):
         """Sets the element material attribute pointer.
@@ -1649,7 +1745,7 @@ class Meshing:
         >>> mapdl.mat(2)
         """
         command = f"MAT,{mat}"
-        return self.run(command, **kwargs)
+        return self.run(command.rstrip(","), **kwargs)
 
     def mcheck(self, lab="", **kwargs):
         """Checks mesh connectivity.
@@ -1703,7 +1799,7 @@ class Meshing:
         the model.
         """
         command = f"MCHECK,{lab}"
-        return self.run(command, **kwargs)
+        return self.run(command.rstrip(","), **kwargs)
 
     def modmsh(self, lab="", **kwargs):
         """Controls the relationship of the solid model and the FE model.
@@ -1750,7 +1846,7 @@ class Meshing:
         or to clear the mesh.
         """
         command = f"MODMSH,{lab}"
-        return self.run(command, **kwargs)
+        return self.run(command.rstrip(","), **kwargs)
 
     def mopt(self, lab="", value="", **kwargs):
         """Specifies meshing options.
@@ -1834,7 +1930,7 @@ class Meshing:
             This option affects the element and node numbering after clearing a mesh.  If Value = ON (default), the starting node and element numbers will be the lowest available number after the nodes and elements are cleared.  If Value = OFF, the  starting node and element numbers are not reset after the clear operation. - PYRA
         """
         command = f"MOPT,{lab},{value}"
-        return self.run(command, **kwargs)
+        return self.run(command.rstrip(","), **kwargs)
 
     def mshape(self, key="", dimension="", **kwargs):
         """For elements that support multiple shapes, specifies the element shape
@@ -1873,8 +1969,11 @@ class Meshing:
 
         This command is also valid for rezoning.
         """
+        _check_key(key, (0, 1))
+        if isinstance(dimension, str) and not _is_valid_label(dimension, ("2D", "3D")):
+            raise ValueError(f"'dimension' must be '2D' or '3D', not '{dimension}'.")
         command = f"MSHAPE,{key},{dimension}"
-        return self.run(command, **kwargs)
+        return self.run(command.rstrip(","), **kwargs)
 
     def mshcopy(
         self,
@@ -1937,7 +2036,7 @@ class Meshing:
         command = (
             f"MSHCOPY,{keyla},{laptrn},{lacopy},{kcn},{dx},{dy},{dz},{tol},{low},{high}"
         )
-        return self.run(command, **kwargs)
+        return self.run(command.rstrip(","), **kwargs)
 
     def mshkey(self, key="", **kwargs):
         """Specifies whether free meshing or mapped meshing should be used to mesh
@@ -1965,8 +2064,9 @@ class Meshing:
 
         This command is also valid for rezoning.
         """
+        _check_key(key, (0, 1, 2))
         command = f"MSHKEY,{key}"
-        return self.run(command, **kwargs)
+        return self.run(command.rstrip(","), **kwargs)
 
     def mshmid(self, key="", **kwargs):
         """Specifies placement of midside nodes.
@@ -1993,8 +2093,9 @@ class Meshing:
 
         This command is also valid for rezoning.
         """
+        _check_key(key, (0, 1, 2))
         command = f"MSHMID,{key}"
-        return self.run(command, **kwargs)
+        return self.run(command.rstrip(","), **kwargs)
 
     def mshpattern(self, key="", **kwargs):
         """Specifies pattern to be used for mapped triangle meshing.
@@ -2029,8 +2130,9 @@ class Meshing:
         For details about mapped meshing with triangles, see the Modeling and
         Meshing Guide.
         """
+        _check_key(key, (0, 1, 2))
         command = f"MSHPATTERN,{key}"
-        return self.run(command, **kwargs)
+        return self.run(command.rstrip(","), **kwargs)
 
     def nrefine(
         self,
@@ -2113,8 +2215,9 @@ class Meshing:
 
         This command is also valid for rezoning.
         """
+        _check_refine_options(level, post, retain)
         command = f"NREFINE,{nn1},{nn2},{ninc},{level},{depth},{post},{retain}"
-        return self.run(command, **kwargs)
+        return self.run(command.rstrip(","), **kwargs)
 
     def psmesh(
         self,
@@ -2253,7 +2356,7 @@ class Meshing:
         The PSMESH command is valid for structural analyses only.
         """
         command = f"PSMESH,{secid},{name},{p0},{egroup},{num},{kcn},{kdir},{value},{ndplane},{pstol},{pstype},{ecomp},{ncomp}"
-        return self.run(command, **kwargs)
+        return self.run(command.rstrip(","), **kwargs)
 
     def real(self, nset="", **kwargs):
         """Sets the element real constant set attribute pointer.
@@ -2276,7 +2379,7 @@ class Meshing:
         not refer to the same real constant set.
         """
         command = f"REAL,{nset}"
-        return self.run(command, **kwargs)
+        return self.run(command.rstrip(","), **kwargs)
 
     def rthick(self, par="", iloc="", jloc="", kloc="", lloc="", **kwargs):
         """Defines variable thickness at nodes for shell elements.
@@ -2318,7 +2421,7 @@ class Meshing:
         used for beam elements.
         """
         command = f"RTHICK,{par},{iloc},{jloc},{kloc},{lloc}"
-        return self.run(command, **kwargs)
+        return self.run(command.rstrip(","), **kwargs)
 
     def shpp(self, lab="", value1="", value2="", **kwargs):
         """Controls element shape checking.
@@ -2464,7 +2567,7 @@ class Meshing:
             warning limit for XY element constant Z sets performed at CHECK or
         """
         command = f"SHPP,{lab},{value1},{value2}"
-        return self.run(command, **kwargs)
+        return self.run(command.rstrip(","), **kwargs)
 
     def smrtsize(
         self,
@@ -2594,7 +2697,7 @@ class Meshing:
         Table: 229:: : SMRTSIZE - Argument Values for h-elements
         """
         command = f"SMRTSIZE,{sizlvl},{fac},{expnd},{trans},{angl},{angh},{gratio},{smhlc},{smanc},{mxitr},{sprx}"
-        return self.run(command, **kwargs)
+        return self.run(command.rstrip(","), **kwargs)
 
     def tchg(self, ename1="", ename2="", etype2="", **kwargs):
         """Converts 20-node degenerate tetrahedral elements to their 10-node non-
@@ -2665,7 +2768,7 @@ class Meshing:
         see Meshing Your Solid Model in the Modeling and Meshing Guide
         """
         command = f"TCHG,{ename1},{ename2},{etype2}"
-        return self.run(command, **kwargs)
+        return self.run(command.rstrip(","), **kwargs)
 
     def timp(self, elem="", chgbnd="", implevel="", **kwargs):
         """Improves the quality of tetrahedral elements that are not associated
@@ -2730,7 +2833,7 @@ class Meshing:
         present in the mesh, even when CHGBND = 1.
         """
         command = f"TIMP,{elem},{chgbnd},{implevel}"
-        return self.run(command, **kwargs)
+        return self.run(command.rstrip(","), **kwargs)
 
     def type(self, itype="", **kwargs):
         """Sets the element type attribute pointer.
@@ -2761,7 +2864,7 @@ class Meshing:
         >>> mapdl.type(2)
         """
         command = f"TYPE,{itype}"
-        return self.run(command, **kwargs)
+        return self.run(command.rstrip(","), **kwargs)
 
     def vatt(self, mat="", real="", type_="", esys="", secnum="", **kwargs):
         """Associates element attributes with the selected, unmeshed volumes.
@@ -2793,7 +2896,7 @@ class Meshing:
         in Meshing Your Solid Model of the Modeling and Meshing Guide.
         """
         command = f"VATT,{mat},{real},{type_},{esys},{secnum}"
-        return self.run(command, **kwargs)
+        return self.run(command.rstrip(","), **kwargs)
 
     def vclear(self, nv1="", nv2="", ninc="", **kwargs):
         """Deletes nodes and volume elements associated with selected volumes.
@@ -2821,7 +2924,7 @@ class Meshing:
         node or element reference was deleted.
         """
         command = f"VCLEAR,{nv1},{nv2},{ninc}"
-        return self.run(command, **kwargs)
+        return self.run(command.rstrip(","), **kwargs)
 
     def vimp(self, vol="", chgbnd="", implevel="", **kwargs):
         """Improves the quality of the tetrahedral elements in the selected
@@ -2889,7 +2992,7 @@ class Meshing:
         divisions specified for them [``LESIZE``]).
         """
         command = f"VIMP,{vol},{chgbnd},{implevel}"
-        return self.run(command, **kwargs)
+        return self.run(command.rstrip(","), **kwargs)
 
     def vmesh(self, nv1="", nv2="", ninc="", **kwargs):
         """Generates nodes and volume elements within volumes.
@@ -2927,7 +3030,7 @@ class Meshing:
         >>> mapdl.vmesh(1)
         """
         command = f"VMESH,{nv1},{nv2},{ninc}"
-        return self.run(command, **kwargs)
+        return self.run(command.rstrip(","), **kwargs)
 
     def veorient(self, vnum="", option="", value1="", value2="", **kwargs):
         """Specifies brick element orientation for volume mapped (hexahedron)
@@ -3002,7 +3105,7 @@ class Meshing:
         KZ2) associated with each volume.
         """
         command = f"VEORIENT,{vnum},{option},{value1},{value2}"
-        return self.run(command, **kwargs)
+        return self.run(command.rstrip(","), **kwargs)
 
     def vsweep(self, vnum="", srca="", trga="", lsmo="", **kwargs):
         """Fills an existing unmeshed volume with elements by sweeping the mesh
@@ -3066,4 +3169,4 @@ class Meshing:
         in Meshing Your Solid Model of the Modeling and Meshing Guide.
         """
         command = f"VSWEEP,{vnum},{srca},{trga},{lsmo}"
-        return self.run(command, **kwargs)
+        return self.run(command.rstrip(","), **kwargs)
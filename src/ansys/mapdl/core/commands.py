@@ -221,6 +221,10 @@ def inject_after_return_section(indented_doc_inject, docstring):
 
 def inject_docs(docstring, docstring_injection=None):
     """Inject a string in a docstring"""
+    if docstring is None:
+        # Docstrings are stripped when running with ``python -OO``.
+        return docstring
+
     if not docstring_injection:
         docstring_injection = CMD_DOCSTRING_INJECTION
 
@@ -1430,10 +1430,20 @@ class _MapdlCore(Commands):
             self._parent()._store_commands = True
 
         def __exit__(self, *args):
-            self._parent()._log.debug("Entering chained command mode")
-            self._parent()._chain_stored()
             self._parent()._store_commands = False
 
+            if args[0] is not None:
+                # An exception was raised, let's drop the stored commands.
+                self._parent()._log.debug(
+                    "An exception was found in the `chain_commands` environment. "
+                    "Hence the commands are not sent."
+                )
+                self._parent()._stored_commands = []
+                return None
+
+            self._parent()._log.debug("Exiting chained command mode")
+            self._parent()._chain_stored()
+
     class _RetainRoutine:
         """Store MAPDL's routine when entering and reverts it when exiting."""
 
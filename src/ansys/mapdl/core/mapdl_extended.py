@@ -24,7 +24,7 @@ from functools import wraps
 import os
 import pathlib
 import tempfile
-from typing import Union
+from typing import List, Optional, Union
 import warnings
 
 import numpy as np
@@ -40,10 +40,11 @@ from ansys.mapdl.core.errors import (
     MapdlRuntimeError,
 )
 from ansys.mapdl.core.mapdl_core import _MapdlCore
-from ansys.mapdl.core.mapdl_types import KwargDict, MapdlFloat
+from ansys.mapdl.core.mapdl_types import KwargDict, MapdlFloat, MapdlInt
 from ansys.mapdl.core.misc import (
     allow_iterables_vmin,
     allow_pickable_entities,
+    entities_to_ranges,
     load_file,
     random_string,
     supress_logging,
@@ -2753,3 +2754,450 @@ class _MapdlExtended(_MapdlCommandExtended):
             it4num=it4num,
             **kwargs,
         )
+
+    def _run_on_ranges(self, func, entities, *args, **kwargs):
+        """Run a ``N1, N2, NINC`` command over a set of entities.
+
+        The command is issued once per range of entities. When several
+        ranges are needed, they are sent together using
+        :attr:`Mapdl.non_interactive <ansys.mapdl.core.Mapdl.non_interactive>`.
+        """
+        ranges = entities_to_ranges(entities)
+        if not ranges:
+            raise ValueError("At least one entity number must be provided.")
+
+        if len(ranges) == 1 or self._store_commands:
+            for start, stop, step in ranges:
+                output = func(start, stop, step, *args, **kwargs)
+            return output
+
+        with self.non_interactive:
+            for start, stop, step in ranges:
+                func(start, stop, step, *args, **kwargs)
+
+        mute = kwargs.get("mute")
+        if mute is None:
+            mute = getattr(self, "mute", False)
+
+        if mute:
+            return None
+        return self.last_response
+
+    def amesh_many(self, areas: Union[List[int], NDArray], **kwargs) -> Optional[str]:
+        """Generate nodes and area elements within several areas.
+
+        Area numbers are grouped into ranges and one
+        :func:`Mapdl.amesh() <ansys.mapdl.core.Mapdl.amesh>` command is
+        issued per range. All the commands are sent to MAPDL at once,
+        instead of one round trip per area.
+
+        Parameters
+        ----------
+        areas : list[int] or numpy.ndarray
+            Area numbers to mesh.
+
+        **kwargs : dict, optional
+            Keyword arguments passed to
+            :func:`Mapdl.amesh() <ansys.mapdl.core.Mapdl.amesh>`.
+
+        Returns
+        -------
+        str
+            MAPDL output.
+
+        Examples
+        --------
+        Mesh areas 1 to 10 and 15.
+
+        >>> mapdl.amesh_many([1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 15])
+        """
+        return self._run_on_ranges(self.amesh, areas, **kwargs)
+
+    def aclear_many(self, areas: Union[List[int], NDArray], **kwargs) -> Optional[str]:
+        """Delete nodes and area elements associated with several areas.
+
+        Area numbers are grouped into ranges and one
+        :func:`Mapdl.aclear() <ansys.mapdl.core.Mapdl.aclear>` command is
+        issued per range. All the commands are sent to MAPDL at once,
+        instead of one round trip per area.
+
+        Parameters
+        ----------
+        areas : list[int] or numpy.ndarray
+            Area numbers to clear.
+
+        **kwargs : dict, optional
+            Keyword arguments passed to
+            :func:`Mapdl.aclear() <ansys.mapdl.core.Mapdl.aclear>`.
+
+        Returns
+        -------
+        str
+            MAPDL output.
+
+        Examples
+        --------
+        Clear the mesh of areas 1, 3 and 5.
+
+        >>> mapdl.aclear_many([1, 3, 5])
+        """
+        return self._run_on_ranges(self.aclear, areas, **kwargs)
+
+    def kmesh_many(
+        self, keypoints: Union[List[int], NDArray], **kwargs
+    ) -> Optional[str]:
+        """Generate nodes and point elements at several keypoints.
+
+        Keypoint numbers are grouped into ranges and one
+        :func:`Mapdl.kmesh() <ansys.mapdl.core.Mapdl.kmesh>` command is
+        issued per range. All the commands are sent to MAPDL at once.
+
+        Parameters
+        ----------
+        keypoints : list[int] or numpy.ndarray
+            Keypoint numbers to mesh.
+
+        **kwargs : dict, optional
+            Keyword arguments passed to
+            :func:`Mapdl.kmesh() <ansys.mapdl.core.Mapdl.kmesh>`.
+
+        Returns
+        -------
+        str
+            MAPDL output.
+
+        Examples
+        --------
+        >>> mapdl.kmesh_many([1, 2, 3, 10])
+        """
+        return self._run_on_ranges(self.kmesh, keypoints, **kwargs)
+
+    def kclear_many(
+        self, keypoints: Union[List[int], NDArray], **kwargs
+    ) -> Optional[str]:
+        """Delete nodes and point elements associated with several keypoints.
+
+        Keypoint numbers are grouped into ranges and one
+        :func:`Mapdl.kclear() <ansys.mapdl.core.Mapdl.kclear>` command is
+        issued per range. All the commands are sent to MAPDL at once.
+
+        Parameters
+        ----------
+        keypoints : list[int] or numpy.ndarray
+            Keypoint numbers to clear.
+
+        **kwargs : dict, optional
+            Keyword arguments passed to
+            :func:`Mapdl.kclear() <ansys.mapdl.core.Mapdl.kclear>`.
+
+        Returns
+        -------
+        str
+            MAPDL output.
+
+        Examples
+        --------
+        >>> mapdl.kclear_many([1, 2, 3, 10])
+        """
+        return self._run_on_ranges(self.kclear, keypoints, **kwargs)
+
+    def lclear_many(self, lines: Union[List[int], NDArray], **kwargs) -> Optional[str]:
+        """Delete nodes and line elements associated with several lines.
+
+        Line numbers are grouped into ranges and one
+        :func:`Mapdl.lclear() <ansys.mapdl.core.Mapdl.lclear>` command is
+        issued per range. All the commands are sent to MAPDL at once.
+
+        Parameters
+        ----------
+        lines : list[int] or numpy.ndarray
+            Line numbers to clear.
+
+        **kwargs : dict, optional
+            Keyword arguments passed to
+            :func:`Mapdl.lclear() <ansys.mapdl.core.Mapdl.lclear>`.
+
+        Returns
+        -------
+        str
+            MAPDL output.
+
+        Examples
+        --------
+        >>> mapdl.lclear_many([1, 2, 3, 10])
+        """
+        return self._run_on_ranges(self.lclear, lines, **kwargs)
+
+    def krefine_many(
+        self,
+        keypoints: Union[List[int], NDArray],
+        level: MapdlInt = "",
+        depth: MapdlInt = "",
+        post: str = "",
+        retain: str = "",
+        **kwargs,
+    ) -> Optional[str]:
+        """Refine the mesh around several keypoints.
+
+        Keypoint numbers are grouped into ranges and one
+        :func:`Mapdl.krefine() <ansys.mapdl.core.Mapdl.krefine>` command
+        is issued per range. All the commands are sent to MAPDL at once.
+
+        Parameters
+        ----------
+        keypoints : list[int] or numpy.ndarray
+            Keypoint numbers around which the mesh is refined.
+
+        level : int, optional
+            Amount of refinement to be done. See
+            :func:`Mapdl.krefine() <ansys.mapdl.core.Mapdl.krefine>`.
+
+        depth : int, optional
+            Depth of mesh refinement in terms of the number of elements
+            outward from the indicated keypoints.
+
+        post : str, optional
+            Quality of postprocessing: ``"OFF"``, ``"SMOOTH"`` or
+            ``"CLEAN"``.
+
+        retain : str, optional
+            Whether quadrilateral elements are retained: ``"ON"`` or
+            ``"OFF"``.
+
+        **kwargs : dict, optional
+            Keyword arguments passed to
+            :func:`Mapdl.krefine() <ansys.mapdl.core.Mapdl.krefine>`.
+
+        Returns
+        -------
+        str
+            MAPDL output.
+
+        Examples
+        --------
+        >>> mapdl.krefine_many([1, 5, 9], level=2)
+        """
+        return self._run_on_ranges(
+            self.krefine, keypoints, level, depth, post, retain, **kwargs
+        )
+
+    def erefine_many(
+        self,
+        elements: Union[List[int], NDArray],
+        level: MapdlInt = "",
+        depth: MapdlInt = "",
+        post: str = "",
+        retain: str = "",
+        **kwargs,
+    ) -> Optional[str]:
+        """Refine the mesh around several elements.
+
+        Element numbers are grouped into ranges and one
+        :func:`Mapdl.erefine() <ansys.mapdl.core.Mapdl.erefine>` command
+        is issued per range. All the commands are sent to MAPDL at once.
+
+        Parameters
+        ----------
+        elements : list[int] or numpy.ndarray
+            Element numbers around which the mesh is refined.
+
+        level : int, optional
+            Amount of refinement to be done. See
+            :func:`Mapdl.erefine() <ansys.mapdl.core.Mapdl.erefine>`.
+
+        depth : int, optional
+            Depth of mesh refinement in terms of the number of elements
+            outward from the indicated elements.
+
+        post : str, optional
+            Quality of postprocessing: ``"OFF"``, ``"SMOOTH"`` or
+            ``"CLEAN"``.
+
+        retain : str, optional
+            Whether quadrilateral elements are retained: ``"ON"`` or
+            ``"OFF"``.
+
+        **kwargs : dict, optional
+            Keyword arguments passed to
+            :func:`Mapdl.erefine() <ansys.mapdl.core.Mapdl.erefine>`.
+
+        Returns
+        -------
+        str
+            MAPDL output.
+
+        Examples
+        --------
+        >>> mapdl.erefine_many([10, 20, 30], level=1, depth=2)
+        """
+        return self._run_on_ranges(
+            self.erefine, elements, level, depth, post, retain, **kwargs
+        )
+
+    def lrefine_many(
+        self,
+        lines: Union[List[int], NDArray],
+        level: MapdlInt = "",
+        depth: MapdlInt = "",
+        post: str = "",
+        retain: str = "",
+        **kwargs,
+    ) -> Optional[str]:
+        """Refine the mesh near several lines.
+
+        Line numbers are grouped into ranges and one
+        :func:`Mapdl.lrefine() <ansys.mapdl.core.Mapdl.lrefine>` command
+        is issued per range. All the commands are sent to MAPDL at once.
+
+        Parameters
+        ----------
+        lines : list[int] or numpy.ndarray
+            Line numbers near which the mesh is refined.
+
+        level : int, optional
+            Amount of refinement to be done. See
+            :func:`Mapdl.lrefine() <ansys.mapdl.core.Mapdl.lrefine>`.
+
+        depth : int, optional
+            Depth of mesh refinement in terms of the number of elements
+            outward from the indicated lines.
+
+        post : str, optional
+            Quality of postprocessing: ``"OFF"``, ``"SMOOTH"`` or
+            ``"CLEAN"``.
+
+        retain : str, optional
+            Whether quadrilateral elements are retained: ``"ON"`` or
+            ``"OFF"``.
+
+        **kwargs : dict, optional
+            Keyword arguments passed to
+            :func:`Mapdl.lrefine() <ansys.mapdl.core.Mapdl.lrefine>`.
+
+        Returns
+        -------
+        str
+            MAPDL output.
+
+        Examples
+        --------
+        >>> mapdl.lrefine_many([1, 2, 3, 8], level=2)
+        """
+        return self._run_on_ranges(
+            self.lrefine, lines, level, depth, post, retain, **kwargs
+        )
+
+    def nrefine_many(
+        self,
+        nodes: Union[List[int], NDArray],
+        level: MapdlInt = "",
+        depth: MapdlInt = "",
+        post: str = "",
+        retain: str = "",
+        **kwargs,
+    ) -> Optional[str]:
+        """Refine the mesh around several nodes.
+
+        Node numbers are grouped into ranges and one
+        :func:`Mapdl.nrefine() <ansys.mapdl.core.Mapdl.nrefine>` command
+        is issued per range. All the commands are sent to MAPDL at once.
+
+        Parameters
+        ----------
+        nodes : list[int] or numpy.ndarray
+            Node numbers around which the mesh is refined.
+
+        level : int, optional
+            Amount of refinement to be done. See
+            :func:`Mapdl.nrefine() <ansys.mapdl.core.Mapdl.nrefine>`.
+
+        depth : int, optional
+            Depth of mesh refinement in terms of the number of elements
+            outward from the indicated nodes.
+
+        post : str, optional
+            Quality of postprocessing: ``"OFF"``, ``"SMOOTH"`` or
+            ``"CLEAN"``.
+
+        retain : str, optional
+            Whether quadrilateral elements are retained: ``"ON"`` or
+            ``"OFF"``.
+
+        **kwargs : dict, optional
+            Keyword arguments passed to
+            :func:`Mapdl.nrefine() <ansys.mapdl.core.Mapdl.nrefine>`.
+
+        Returns
+        -------
+        str
+            MAPDL output.
+
+        Examples
+        --------
+        >>> mapdl.nrefine_many(np.array([3, 4, 5, 20]), level=1)
+        """
+        return self._run_on_ranges(
+            self.nrefine, nodes, level, depth, post, retain, **kwargs
+        )
+
+    def vmesh_many(self, volumes: Union[List[int], NDArray], **kwargs) -> Optional[str]:
+        """Generate nodes and volume elements within several volumes.
+
+        Volume numbers are grouped into ranges and one
+        :func:`Mapdl.vmesh() <ansys.mapdl.core.Mapdl.vmesh>` command is
+        issued per range. All the commands are sent to MAPDL at once,
+        instead of one round trip per volume.
+
+        Parameters
+        ----------
+        volumes : list[int] or numpy.ndarray
+            Volume numbers to mesh.
+
+        **kwargs : dict, optional
+            Keyword arguments passed to
+            :func:`Mapdl.vmesh() <ansys.mapdl.core.Mapdl.vmesh>`.
+
+        Returns
+        -------
+        str
+            MAPDL output.
+
+        Examples
+        --------
+        Mesh volumes 1 to 4 and 10.
+
+        >>> mapdl.vmesh_many([1, 2, 3, 4, 10])
+        """
+        return self._run_on_ranges(self.vmesh, volumes, **kwargs)
+
+    def vclear_many(
+        self, volumes: Union[List[int], NDArray], **kwargs
+    ) -> Optional[str]:
+        """Delete nodes and volume elements associated with several volumes.
+
+        Volume numbers are grouped into ranges and one
+        :func:`Mapdl.vclear() <ansys.mapdl.core.Mapdl.vclear>` command is
+        issued per range. All the commands are sent to MAPDL at once,
+        instead of one round trip per volume.
+
+        Parameters
+        ----------
+        volumes : list[int] or numpy.ndarray
+            Volume numbers to clear.
+
+        **kwargs : dict, optional
+            Keyword arguments passed to
+            :func:`Mapdl.vclear() <ansys.mapdl.core.Mapdl.vclear>`.
+
+        Returns
+        -------
+        str
+            MAPDL output.
+
+        Examples
+        --------
+        Clear the mesh of volumes 2 and 4.
+
+        >>> mapdl.vclear_many([2, 4])
+        """
+        return self._run_on_ranges(self.vclear, volumes, **kwargs)
@@ -1107,6 +1107,73 @@ def write_array(filename: Union[str, bytes], array: np.ndarray):
     np.savetxt(filename, array, fmt="%20.12f")
 
 
+def entities_to_ranges(entities):
+    """Group entity numbers into ``(start, stop, step)`` ranges.
+
+    Entity numbers are sorted and duplicates are removed. Each range can
+    be used in the ``N1, N2, NINC`` fields of MAPDL commands such as
+    ``AMESH`` or ``KMESH``.
+
+    Parameters
+    ----------
+    entities : list[int] or numpy.ndarray
+        Entity numbers.
+
+    Returns
+    -------
+    list[tuple[int, int, int]]
+        Ranges given as ``(start, stop, step)``. Isolated entities are
+        returned as ``(entity, entity, 1)``.
+
+    Raises
+    ------
+    ValueError
+        If ``entities`` is not a one-dimensional sequence of positive
+        integers.
+
+    Examples
+    --------
+    >>> entities_to_ranges([1, 2, 3, 7, 9, 11, 20])
+    [(1, 3, 1), (7, 11, 2), (20, 20, 1)]
+    """
+    entities = np.asarray(entities)
+    if entities.ndim != 1:
+        raise ValueError("Entity numbers must be given as a one-dimensional sequence.")
+
+    if not np.issubdtype(entities.dtype, np.integer):
+        if not np.issubdtype(entities.dtype, np.floating) or np.any(entities % 1):
+            raise ValueError("Entity numbers must be integers.")
+        entities = entities.astype(int)
+
+    if entities.size and entities.min() < 1:
+        raise ValueError("Entity numbers must be greater than or equal to 1.")
+
+    ids = np.unique(entities).tolist()
+
+    ranges = []
+    ind = 0
+    while ind < len(ids):
+        start = ids[ind]
+        stop_ind = ind
+        step = 1
+
+        if ind + 1 < len(ids):
+            step = ids[ind + 1] - start
+            stop_ind = ind + 1
+            while stop_ind + 1 < len(ids) and ids[stop_ind + 1] - ids[stop_ind] == step:
+                stop_ind += 1
+
+            if stop_ind == ind + 1 and step != 1 and stop_ind + 1 < len(ids):
+                # A lone pair with a gap might be the start of a longer range.
+                stop_ind = ind
+                step = 1
+
+        ranges.append((start, ids[stop_ind], step))
+        ind = stop_ind + 1
+
+    return ranges
+
+
 def requires_package(package_name, softerror=False):
     """
     Decorator check whether a package is installed or not.
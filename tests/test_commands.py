@@ -34,6 +34,7 @@ from ansys.mapdl.core.commands import (
     CommandOutput,
     Commands,
     StringWithLiteralRepr,
+    inject_docs,
 )
 from ansys.mapdl.core.examples import verif_files
 from conftest import has_dependency, requires
@@ -690,6 +691,11 @@ def test_docstring_injector(mapdl, method):
             assert "to_dataframe()" in docstring
 
 
+def test_docstring_injector_stripped_docstring():
+    # Running with ``python -OO`` removes the docstrings.
+    assert inject_docs(None) is None
+
+
 def test_string_with_literal():
     base_ = "asdf\nasdf"
     output = StringWithLiteralRepr(base_)
@@ -455,6 +455,187 @@ def test_chaining(mapdl, cleared):
         assert mapdl.geometry.n_keypoint == 1000
 
 
+def test_chaining_exception(mapdl, cleared):
+    if mapdl._distributed:
+        pytest.skip("Chained commands are not permitted in distributed MAPDL.")
+
+    mapdl.prep7()
+    with pytest.raises(ValueError):
+        with mapdl.chain_commands:
+            mapdl.k(1, 0, 0, 0)
+            raise ValueError("Stop chaining")
+
+    assert not mapdl._store_commands
+    assert not mapdl._stored_commands
+    assert mapdl.geometry.n_keypoint == 0
+
+    # Commands are sent again after leaving the context.
+    mapdl.k(1, 0, 0, 0)
+    assert mapdl.geometry.n_keypoint == 1
+
+
+def test_amesh_many(mapdl, cleared):
+    mapdl.block(0, 1, 0, 1, 0, 1)
+    mapdl.et(1, 181)
+    mapdl.esize(0.5)
+
+    mapdl.amesh_many([1, 2, 3, 5])
+    assert mapdl.get_value("ELEM", 0, "count") == 16
+
+    mapdl.aclear_many([1, 2, 3, 5])
+    assert mapdl.get_value("ELEM", 0, "count") == 0
+
+    with pytest.raises(ValueError):
+        mapdl.amesh_many([])
+
+
+def test_kmesh_many(mapdl, cleared):
+    mapdl.et(1, "MASS21")
+    for i in range(1, 8):
+        mapdl.k(i, i, 0, 0)
+
+    mapdl.kmesh_many([1, 2, 3, 5, 7])
+    assert mapdl.get_value("ELEM", 0, "count") == 5
+
+    mapdl.kclear_many([1, 2, 3])
+    assert mapdl.get_value("ELEM", 0, "count") == 2
+
+
+def test_lclear_many(mapdl, cleared):
+    mapdl.et(1, "LINK180")
+    mapdl.rectng(0, 4, 0, 4)
+    mapdl.esize(1)
+    mapdl.lmesh("ALL")
+    assert mapdl.get_value("ELEM", 0, "count") == 16
+
+    output = mapdl.lclear_many([1, 2, 4])
+    assert isinstance(output, str)
+    assert mapdl.get_value("ELEM", 0, "count") == 4
+
+
+@pytest.mark.parametrize(
+    "func,entities", [("krefine_many", [1, 2, 4]), ("erefine_many", [1, 2, 3, 10])]
+)
+def test_refine_many(mapdl, cleared, func, entities):
+    mapdl.et(1, "PLANE182")
+    mapdl.rectng(0, 4, 0, 4)
+    mapdl.esize(1)
+    mapdl.amesh("ALL")
+    assert mapdl.get_value("ELEM", 0, "count") == 16
+
+    output = getattr(mapdl, func)(entities, level=1, depth=1, post="OFF", mute=True)
+    assert output is None
+    assert mapdl.get_value("ELEM", 0, "count") > 16
+
+
+def test_many_global_mute(mapdl, cleared):
+    mapdl.et(1, "MASS21")
+    for i in range(1, 6):
+        mapdl.k(i, i, 0, 0)
+
+    mapdl.mute = True
+    try:
+        output = mapdl.kmesh_many([1, 2, 5])
+    finally:
+        mapdl.mute = False
+
+    assert output is None
+    assert mapdl.get_value("ELEM", 0, "count") == 3
+
+
+def test_lrefine_many(mapdl, cleared):
+    mapdl.et(1, "PLANE182")
+    mapdl.rectng(0, 4, 0, 4)
+    mapdl.esize(1)
+    mapdl.amesh("ALL")
+    assert mapdl.get_value("ELEM", 0, "count") == 16
+
+    mapdl.lrefine_many([1, 3], level=1, depth=1)
+    assert mapdl.get_value("ELEM", 0, "count") > 16
+
+
+def test_nrefine_many(mapdl, cleared):
+    mapdl.et(1, "PLANE182")
+    mapdl.rectng(0, 4, 0, 4)
+    mapdl.esize(1)
+    mapdl.amesh("ALL")
+    assert mapdl.get_value("ELEM", 0, "count") == 16
+
+    mapdl.nrefine_many([1, 2, 3], level=1)
+    assert mapdl.get_value("ELEM", 0, "count") > 16
+
+
+def test_vmesh_many(mapdl, cleared):
+    mapdl.et(1, "SOLID185")
+    for i in range(3):
+        mapdl.block(2 * i, 2 * i + 1, 0, 1, 0, 1)
+    mapdl.esize(1)
+
+    mapdl.vmesh_many([1, 3])
+    assert mapdl.get_value("ELEM", 0, "count") == 2
+
+    mapdl.vclear_many([1, 3])
+    assert mapdl.get_value("ELEM", 0, "count") == 0
+
+
+def test_meshing_trailing_fields(mapdl, cleared):
+    mapdl.et(1, "PLANE182")
+    mapdl.rectng(0, 1, 0, 1)
+
+    with mapdl.non_interactive:
+        mapdl.amesh(1)
+        assert mapdl._stored_commands[-1] == "AMESH,1"
+
+        mapdl.erefine(1, level=2)
+        assert mapdl._stored_commands[-1] == "EREFINE,1,,,2"
+
+        mapdl.latt(1, kb=2)
+        assert mapdl._stored_commands[-1] == "LATT,1,,,,2"
+
+        mapdl.mshkey()
+        assert mapdl._stored_commands[-1] == "MSHKEY"
+
+
+@pytest.mark.parametrize(
+    "func", ["arefine", "erefine", "krefine", "lrefine", "nrefine"]
+)
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"level": 0},
+        {"level": 6},
+        {"level": np.int64(9)},
+        {"level": 7.0},
+        {"level": 2.5},
+        {"level": True},
+        {"post": "FAST"},
+        {"retain": "YES"},
+    ],
+)
+def test_refine_invalid_options(mapdl, func, kwargs):
+    with pytest.raises(ValueError):
+        getattr(mapdl, func)("ALL", **kwargs)
+
+
+@pytest.mark.parametrize(
+    "func,args",
+    [
+        ("mshape", (2,)),
+        ("mshape", (0, "4D")),
+        ("mshkey", (3,)),
+        ("mshkey", (np.int64(5),)),
+        ("mshkey", (1.5,)),
+        ("mshkey", (True,)),
+        ("mshape", (np.bool_(True),)),
+        ("mshmid", (-1,)),
+        ("mshpattern", (3,)),
+    ],
+)
+def test_meshing_key_invalid(mapdl, func, args):
+    with pytest.raises(ValueError):
+        getattr(mapdl, func)(*args)
+
+
 def test_error(mapdl):
     with pytest.raises(MapdlRuntimeError):
         mapdl.prep7()
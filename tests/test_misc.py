@@ -37,6 +37,7 @@ from ansys.mapdl.core.misc import (
     check_valid_ip,
     check_valid_port,
     check_valid_routine,
+    entities_to_ranges,
     last_created,
     load_file,
     no_return,
@@ -376,3 +377,35 @@ def test_check_valid_routine():
     assert check_valid_routine("begin level")
     with pytest.raises(ValueError, match="Invalid routine"):
         check_valid_routine("invalid")
+
+
+@pytest.mark.parametrize(
+    "entities,ranges",
+    [
+        ([1], [(1, 1, 1)]),
+        ([3, 1, 2, 2], [(1, 3, 1)]),
+        ([1, 2, 3, 7, 9, 11, 20], [(1, 3, 1), (7, 11, 2), (20, 20, 1)]),
+        ([1, 5, 6, 7], [(1, 1, 1), (5, 7, 1)]),
+        ([1, 5], [(1, 5, 4)]),
+        (np.array([10, 20, 30]), [(10, 30, 10)]),
+        ([1.0, 2.0], [(1, 2, 1)]),
+        ([], []),
+    ],
+)
+def test_entities_to_ranges(entities, ranges):
+    assert entities_to_ranges(entities) == ranges
+
+
+@pytest.mark.parametrize(
+    "entities",
+    [
+        [1.5, 2.2],
+        [[1, 2], [3, 4]],
+        [-1, 0, 1],
+        ["1", "2"],
+        (i for i in range(1, 4)),
+    ],
+)
+def test_entities_to_ranges_invalid(entities):
+    with pytest.raises(ValueError):
+        entities_to_ranges(entities)